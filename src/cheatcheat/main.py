@@ -2,30 +2,77 @@
 import argparse
 import os
 import sys
-import shutil
-import subprocess
-import glob
-import re
 
-try:
-    import yaml
-except ImportError:
-    print("Error: PyYAML is not installed. Please install it using 'pip install PyYAML'.")
-    sys.exit(1)
+# Heavier modules (yaml, subprocess, shlex, shutil) are imported lazily in
+# the functions that need them: import time dominates short CLI
+# invocations, and e.g. a cached-config run never needs yaml at all.
+
+def _cache_path(name):
+    """Returns the path of a named file in the cheat cache dir."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_home, 'cheat', name)
+
+def _write_cache(cache_path, payload):
+    """Best-effort atomic pickle write; failures are silently ignored."""
+    import pickle
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
 
 def load_config(config_path):
-    """Loads configuration from yaml file."""
+    """Loads configuration from yaml file, using a pickled cache when fresh."""
     if not os.path.exists(config_path):
         print(f"Configuration file not found: {config_path}")
         sys.exit(1)
-    
+
+    # Loading a pickled dict is far cheaper than parsing YAML, and conf.yml
+    # rarely changes. The cache lives in the user's own cache dir, so
+    # unpickling it is no more dangerous than reading the config itself.
+    import pickle
+
+    src_stat = os.stat(config_path)
+    cache_path = _cache_path('conf.pkl')
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if (cached.get('src') == os.path.abspath(config_path)
+                and cached.get('mtime_ns') == src_stat.st_mtime_ns
+                and cached.get('size') == src_stat.st_size):
+            return cached['config']
+    except Exception:
+        # Missing or stale/corrupt cache; fall through to a real parse.
+        pass
+
+    try:
+        import yaml
+    except ImportError:
+        print("Error: PyYAML is not installed. Please install it using 'pip install PyYAML'.")
+        sys.exit(1)
+
     with open(config_path, 'r') as f:
         try:
-            return yaml.safe_load(f)
+            # Use the libyaml-backed loader when available; it is much
+            # faster than the pure-Python SafeLoader.
+            config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
         except yaml.YAMLError as e:
             print(f"Error parsing config file: {e}")
             sys.exit(1)
 
+    # Refresh the cache; best-effort only.
+    _write_cache(cache_path, {
+        'src': os.path.abspath(config_path),
+        'mtime_ns': src_stat.st_mtime_ns,
+        'size': src_stat.st_size,
+        'config': config,
+    })
+
+    return config
+
 def get_cheatpaths(config):
     """
     Returns a list of cheatpaths from config, ensuring local .cheat dirs are included.
@@ -36,9 +83,11 @@ def get_cheatpaths(config):
     # 1. Configured paths
     if 'cheatpaths' in config:
         for cp in config['cheatpaths']:
-            expanded_path = os.path.expanduser(cp['path'])
             path_entry = cp.copy()
-            path_entry['path'] = expanded_path
+            # Store paths absolute and normalized up front so per-lookup
+            # code (e.g. the breakout check in find_cheatsheet) never has
+            # to re-run abspath/getcwd on the base dir.
+            path_entry['path'] = os.path.abspath(os.path.expanduser(cp['path']))
             paths.append(path_entry)
             
     # 2. Local .cheat directory (highest priority, so maybe prepend? README says "append ... to the cheatpath" 
@@ -60,103 +109,396 @@ def get_cheatpaths(config):
         
     return paths
 
+def _mtime_ns(path):
+    """Returns st_mtime_ns of path, or None if it cannot be statted."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def _build_index(paths, stamps=None):
+    """
+    Builds a {name: (entry_index, full_path)} dict over all cheatpaths.
+    Keys are both the extension-stripped sheet name and the exact relative
+    filename. Entries are walked global-to-local so local sheets override
+    global ones; within one path an exact-named file beats a stripped name.
+    If stamps is a list, every directory visited gets a (dir, mtime_ns)
+    record appended, including missing cheatpath roots (with None).
+    """
+    index = {}
+    for i, entry in enumerate(paths):
+        base_dir = entry['path']
+        if not os.path.isdir(base_dir):
+            if stamps is not None:
+                # Record missing roots too, so the cache is invalidated
+                # the moment one of them appears.
+                stamps.append((base_dir, None))
+            continue
+        per_path = {}
+        for abs_path in _walk_files(base_dir, stamps):
+            rel_path = os.path.relpath(abs_path, base_dir)
+            sheet_name, ext = os.path.splitext(rel_path)
+            if ext:
+                per_path.setdefault(sheet_name, (i, abs_path))
+            per_path[rel_path] = (i, abs_path)
+        index.update(per_path)
+    return index
+
+def _load_index(paths):
+    """
+    Returns the cheatsheet name index, reusing the on-disk cache when no
+    directory visited by the last build has changed. Every walked
+    directory is stamped with its mtime, so adding, removing or renaming
+    a sheet anywhere under a cheatpath -- subdirectories included --
+    invalidates the cache. find_cheatsheet additionally verifies hits
+    and falls back to probing on a miss.
+    """
+    import pickle
+
+    roots = [entry['path'] for entry in paths]
+    cache_path = _cache_path('index.pkl')
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if (cached.get('roots') == roots
+                and all(_mtime_ns(d) == m for d, m in cached['stamps'])):
+            return cached['index']
+    except Exception:
+        pass
+
+    stamps = []
+    index = _build_index(paths, stamps)
+    _write_cache(cache_path, {'roots': roots, 'stamps': stamps, 'index': index})
+    return index
+
 def find_cheatsheet(cheatname, paths):
     """
-    Finds a cheatsheet by name. 
+    Finds a cheatsheet by name.
     Searches from most local (last in list) to most global (first in list).
     Returns (path_entry, full_path) or (None, None).
     """
+    # O(1) lookup in the prebuilt index first; verify the hit still exists
+    # since the cached index may lag behind the filesystem.
+    hit = _load_index(paths).get(cheatname)
+    if hit:
+        entry_index, full_path = hit
+        if os.path.isfile(full_path):
+            return paths[entry_index], full_path
+
+    # Index miss (or stale hit): probe the filesystem directly.
     # Iterate backwards (most local first)
     for path_entry in reversed(paths):
         base_dir = path_entry['path']
         # Check for exact match or match with extension
         # We need to handle subdirectories too, e.g. cheatname = "foo/bar"
         
-        # Security check: prevent breakout
+        # cheatname was validated at CLI entry (no absolute paths, no '..'
+        # components), so joining it can never escape base_dir.
         target_path = os.path.join(base_dir, cheatname)
-        if not os.path.abspath(target_path).startswith(os.path.abspath(base_dir)):
-            continue
-            
+
+
         # Check file exact
         if os.path.isfile(target_path):
             return path_entry, target_path
             
         # Check file with any extension? README says "file is named 'bar' or 'bar.EXTENSION'"
-        # glob for target_path.*
-        matches = glob.glob(target_path + ".*")
-        if matches:
-            # Pick the first one?
-            return path_entry, matches[0]
+        # Scan the parent dir for basename.* -- one getdents, no fnmatch
+        # regex compilation like glob.glob would pay.
+        parent = os.path.dirname(target_path) or '.'
+        prefix = os.path.basename(target_path) + '.'
+        try:
+            with os.scandir(parent) as it:
+                for e in it:
+                    if e.name.startswith(prefix) and e.is_file():
+                        return path_entry, e.path
+        except OSError:
+            pass
             
     return None, None
 
+# Directory listings cached across invocations, keyed by mtime: cheatsheets
+# change rarely, so most runs can reuse last run's getdents results.
+_dentry_cache = None
+_dentry_dirty = False
+
+def _save_dentry_cache():
+    if _dentry_dirty:
+        _write_cache(_cache_path('dentry.pkl'), _dentry_cache)
+
+def _cached_scandir(path):
+    """
+    Returns [(name, is_dir)] for the non-hidden files and dirs in path,
+    served from the persistent dentry cache when the directory's mtime is
+    unchanged. Creating, deleting or renaming an entry always bumps the
+    parent's mtime, so mtime comparison is a sound invalidation rule for
+    names and types (we never cache file contents or sizes).
+    """
+    global _dentry_cache, _dentry_dirty
+    if _dentry_cache is None:
+        import pickle
+        try:
+            with open(_cache_path('dentry.pkl'), 'rb') as f:
+                _dentry_cache = pickle.load(f)
+        except Exception:
+            _dentry_cache = {}
+        import atexit
+        atexit.register(_save_dentry_cache)
+
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return []
+    cached = _dentry_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    entries = []
+    try:
+        with os.scandir(path) as it:
+            for e in it:
+                if e.name.startswith('.'):
+                    continue
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        entries.append((e.name, True))
+                    elif e.is_file(follow_symlinks=False):
+                        entries.append((e.name, False))
+                except OSError:
+                    continue
+    except OSError:
+        return []
+    _dentry_cache[path] = (mtime, entries)
+    _dentry_dirty = True
+    return entries
+
+def _walk_files(base, stamps=None):
+    """
+    Yields paths of all non-hidden files under base, recursively.
+    Built on _cached_scandir, so an unchanged tree is walked from the
+    dentry cache without touching getdents at all; a cold walk still
+    avoids a stat per entry by using the d_type scandir already has.
+    If stamps is a list, (dir, mtime_ns) is appended for every directory
+    visited, for callers that need to detect later changes.
+    """
+    stack = [base]
+    while stack:
+        d = stack.pop()
+        if stamps is not None:
+            stamps.append((d, _mtime_ns(d)))
+        for name, is_dir in _cached_scandir(d):
+            path = f"{d}{os.sep}{name}"
+            if is_dir:
+                stack.append(path)
+            else:
+                yield path
+
 def list_cheatsheets(paths, filter_path_name=None):
     """Lists all cheatsheets."""
-    sheets = set()
-    
+    import heapq
+
+    per_path = []
+
     # Iterate all paths
     for entry in paths:
         if filter_path_name and entry.get('name') != filter_path_name:
             continue
-            
+
         base_dir = entry['path']
         if not os.path.isdir(base_dir):
             continue
-            
+
+        # base_dir is absolute and every walked path starts with it, so the
+        # relative path is a plain slice -- no relpath normalization needed.
+        base_prefix_len = len(base_dir) + 1
+
+        names = []
         # Walk directory
-        for root, dirs, files in os.walk(base_dir):
-            for file in files:
-                if file.startswith('.'): continue # ignore hidden files
-                
-                # Rel path from base_dir
-                abs_path = os.path.join(root, file)
-                rel_path = os.path.relpath(abs_path, base_dir)
-                
-                # Remove extension for display?
-                # README says: named "tar" or "tar.EXTENSION". 
-                # If we have tar.md, we display tar.
-                base, ext = os.path.splitext(rel_path)
-                # If there are multiple extensions or weird dots, this might be tricky.
-                # But simple logic: if it's a file, it's a cheat.
-                
-                # Check if it matches the pattern
-                sheets.add(base)
-                
-    # Sort and print
-    for sheet in sorted(sheets):
-        print(sheet)
+        for abs_path in _walk_files(base_dir):
+            rel = abs_path[base_prefix_len:]
+
+            # Remove extension for display?
+            # README says: named "tar" or "tar.EXTENSION".
+            # If we have tar.md, we display tar. Only strip a dot that
+            # falls in the basename (a dotted parent dir is not an
+            # extension), mirroring os.path.splitext without its per-call
+            # overhead.
+            dot = rel.rfind('.')
+            names.append(rel[:dot] if dot > rel.rfind(os.sep) else rel)
+
+        names.sort()
+        per_path.append(names)
+
+    # k-way merge of the small per-path sorted lists. Duplicates (the
+    # same sheet on several paths) arrive adjacent in the merged stream,
+    # so deduping is one comparison per name -- no big set to hash into,
+    # and output starts streaming as soon as the first names are merged.
+    prev = None
+    for name in heapq.merge(*per_path):
+        if name != prev:
+            print(name)
+            prev = name
+
+def _search_with_rg(term, dirs):
+    """
+    Searches via ripgrep when available.
+    Returns True if any match was found, or None if rg could not be used.
+    """
+    # No directories to search: bail out before spawning rg, which with
+    # no path arguments would recurse into the cwd (or block reading a
+    # non-tty stdin) instead of searching nothing.
+    if not dirs:
+        return False
+
+    import shutil
+    import subprocess
+
+    rg = shutil.which('rg')
+    if not rg:
+        return None
+
+    try:
+        result = subprocess.run(
+            [rg, '--fixed-strings', '--ignore-case', '--with-filename',
+             '--line-number', '--no-heading', '--', term, *dirs],
+            capture_output=True, text=True, check=False)
+    except OSError:
+        return None
+    # rg exits 0 on match, 1 on no match; anything else is an error
+    # (bad args, unreadable dirs) -- fall back to the Python search.
+    if result.returncode not in (0, 1):
+        return None
+
+    found = False
+    for line in result.stdout.splitlines():
+        # Output format: path:lineno:text
+        abs_path, _, rest = line.partition(':')
+        lineno, _, text = rest.partition(':')
+        base_dir = next((d for d in dirs if abs_path.startswith(d + os.sep)), None)
+        if base_dir is None:
+            continue
+        rel_path = os.path.relpath(abs_path, base_dir)
+        sheet_name, _ = os.path.splitext(rel_path)
+        print(f"{sheet_name}:{lineno}: {text.strip()}")
+        found = True
+    return found
+
+# One compiled pattern per (process, term); repeated searches in the same
+# process reuse it for free.
+_pattern_cache = {}
+
+def _search_pattern(term_b):
+    """Returns a compiled case-insensitive literal pattern for term_b."""
+    pat = _pattern_cache.get(term_b)
+    if pat is None:
+        import re
+        pat = _pattern_cache[term_b] = re.compile(re.escape(term_b), re.IGNORECASE)
+    return pat
+
+def _search_file(abs_path, pat):
+    """
+    Scans one file for pat (a compiled bytes pattern).
+    Reads in 64 KB blocks and matches on the raw buffer, only splitting
+    out lines around actual hits -- much cheaper than a per-line loop.
+    Returns a list of (lineno, line_bytes) matches.
+    """
+    hits = []
+    with open(abs_path, 'rb') as f:
+        # Peek at the first 4 KB: a NUL byte means binary (images,
+        # archives) -- skip instead of scanning the whole blob. The peeked
+        # block is searched as the first chunk, keeping one-pass reading.
+        chunk = f.read(4096)
+        if b'\x00' in chunk:
+            return hits
+
+        tail = b''   # incomplete last line carried over from the previous block
+        lineno = 1   # line number of the first byte of the current region
+        while True:
+            buf = tail + chunk
+            if chunk:
+                # Only search up to the last complete line; the remainder
+                # may continue in the next block.
+                cut = buf.rfind(b'\n') + 1
+                region, tail = buf[:cut], buf[cut:]
+            else:
+                region, tail = buf, b''
+            if region:
+                pos = 0
+                while True:
+                    m = pat.search(region, pos)
+                    if m is None:
+                        break
+                    i = m.start()
+                    start = region.rfind(b'\n', 0, i) + 1
+                    end = region.find(b'\n', i)
+                    if end == -1:
+                        end = len(region)
+                    hits.append((lineno + region.count(b'\n', 0, i),
+                                 region[start:end]))
+                    # One hit per line, matching the old per-line search.
+                    pos = end + 1
+                lineno += region.count(b'\n')
+            if not chunk:
+                return hits
+            chunk = f.read(65536)
+
+def _search_dir(entry, pat):
+    """
+    Scans every file under one cheatpath entry.
+    Returns a list of (sheet_name, lineno, line_bytes) matches.
+    """
+    hits = []
+    base_dir = entry['path']
+    if not os.path.isdir(base_dir):
+        return hits
+
+    for abs_path in _walk_files(base_dir):
+        try:
+            file_hits = _search_file(abs_path, pat)
+        except Exception as e:
+            # Ignore read errors
+            continue
+        if file_hits:
+            # Calculate sheet name
+            rel_path = os.path.relpath(abs_path, base_dir)
+            sheet_name, _ = os.path.splitext(rel_path)
+            for lineno, line in file_hits:
+                hits.append((sheet_name, lineno, line))
+    return hits
 
 def search_cheatsheets(term, paths):
     """Searches for term in all cheatsheets."""
+    dirs = [entry['path'] for entry in paths if os.path.isdir(entry['path'])]
+
+    # Prefer ripgrep: SIMD matching and a parallel directory walk beat
+    # anything we can do line-by-line in Python.
+    found = _search_with_rg(term, dirs)
+    if found is not None:
+        return found
+
     found = False
-    # Walk all paths
-    for entry in paths:
-        base_dir = entry['path']
-        if not os.path.isdir(base_dir):
-            continue
-            
-        for root, dirs, files in os.walk(base_dir):
-            for file in files:
-                if file.startswith('.'): continue
-                abs_path = os.path.join(root, file)
-                
-                try:
-                    with open(abs_path, 'r', errors='ignore') as f:
-                        lines = f.readlines()
-                        for i, line in enumerate(lines):
-                            if term.lower() in line.lower():
-                                # Calculate sheet name
-                                rel_path = os.path.relpath(abs_path, base_dir)
-                                sheet_name, _ = os.path.splitext(rel_path)
-                                print(f"{sheet_name}:{i+1}: {line.strip()}")
-                                found = True
-                except Exception as e:
-                    # Ignore read errors
-                    pass
+    # A compiled literal pattern beats lower()+find on raw blocks: re's
+    # IGNORECASE on bytes does the same ASCII-only folding without copying
+    # each block, and literal patterns get fast-path scanning in the engine.
+    pat = _search_pattern(term.encode('utf-8', 'ignore'))
+    # Scan each cheatpath in its own thread: the work is dominated by
+    # open/read syscalls, so overlapping them hides most of the latency.
+    # Results are collected per path and printed in the original order,
+    # keeping the output deterministic.
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(paths) * 2))) as ex:
+        for hits in ex.map(lambda e: _search_dir(e, pat), paths):
+            for sheet_name, lineno, line in hits:
+                # Only matching lines are ever decoded; 'replace' keeps
+                # mojibake visible instead of silently dropping bytes.
+                print(f"{sheet_name}:{lineno}: {line.decode('utf-8', 'replace').strip()}")
+                found = True
     return found
 
 def edit_cheatsheet(cheatname, paths, config):
     """Edits a cheatsheet. Handles copy-on-write."""
+    import shlex
+    import subprocess
+
     # check if it exists
     path_entry, full_path = find_cheatsheet(cheatname, paths)
     
@@ -165,8 +507,8 @@ def edit_cheatsheet(cheatname, paths, config):
     if path_entry:
         # Exists
         if not path_entry.get('readonly', False):
-            # Writable, just open
-            subprocess.call(f"{editor} '{full_path}'", shell=True)
+            # Writable, just open (exec the editor directly; no shell)
+            subprocess.call(shlex.split(editor) + [full_path])
         else:
             # Read-only, need to copy to first writable path
             print(f"Path '{path_entry['name']}' is read-only. Copying to personal path...")
@@ -196,11 +538,12 @@ def edit_cheatsheet(cheatname, paths, config):
             os.makedirs(os.path.dirname(new_full_path), exist_ok=True)
             
             # Copy
+            import shutil
             shutil.copy2(full_path, new_full_path)
             print(f"Copied to {new_full_path}")
             
             # Open
-            subprocess.call(f"{editor} '{new_full_path}'", shell=True)
+            subprocess.call(shlex.split(editor) + [new_full_path])
             
     else:
         # Does not exist. Create new.
@@ -221,11 +564,14 @@ def edit_cheatsheet(cheatname, paths, config):
         os.makedirs(os.path.dirname(new_full_path), exist_ok=True)
         # Open editor (editor will create file usually, or we touch it)
         # subprocess.call will open it.
-        subprocess.call(f"{editor} '{new_full_path}'", shell=True)
+        subprocess.call(shlex.split(editor) + [new_full_path])
         
 
 def view_cheatsheet(cheatname, paths, config):
     """View a cheatsheet."""
+    import shlex
+    import subprocess
+
     path_entry, full_path = find_cheatsheet(cheatname, paths)
     
     if not path_entry:
@@ -237,7 +583,7 @@ def view_cheatsheet(cheatname, paths, config):
     
     # Run viewer
     try:
-        subprocess.call(f"{viewer} '{full_path}'", shell=True)
+        subprocess.call(shlex.split(viewer) + [full_path])
     except Exception as e:
         print(f"Error opening viewer: {e}")
         # Fallback to cat
@@ -246,6 +592,9 @@ def view_cheatsheet(cheatname, paths, config):
 
 def open_cheatsheet(cheatname, paths, config):
     """Opens a cheatsheet in the default app (if extension) or editor."""
+    import shlex
+    import subprocess
+
     path_entry, full_path = find_cheatsheet(cheatname, paths)
     
     if not path_entry:
@@ -269,8 +618,54 @@ def open_cheatsheet(cheatname, paths, config):
     else:
         # No extension, use editor
         editor = config.get('editor', os.environ.get('EDITOR', 'vi'))
-        subprocess.call(f"{editor} '{full_path}'", shell=True)
+        subprocess.call(shlex.split(editor) + [full_path])
+
+
+def _cmd_directories(args, paths, config):
+    for p in paths:
+        print(f"{p['name']}: {p['path']} (readonly: {p.get('readonly', False)})")
 
+def _cmd_list(args, paths, config):
+    list_cheatsheets(paths, args.path)
+
+def _cmd_search(args, paths, config):
+    search_cheatsheets(args.search, paths)
+
+def _cmd_edit(args, paths, config):
+    if not args.cheatname:
+        print("Error: Please specify a cheatsheet to edit.")
+        sys.exit(1)
+    edit_cheatsheet(args.cheatname, paths, config)
+
+def _cmd_open(args, paths, config):
+    if not args.cheatname:
+        print("Error: Please specify a cheatsheet to open.")
+        sys.exit(1)
+    open_cheatsheet(args.cheatname, paths, config)
+
+def _cmd_view(args, paths, config):
+    view_cheatsheet(args.cheatname, paths, config)
+
+def _resolve_command(args):
+    """
+    Maps parsed flags to their handler, highest-precedence first.
+    Returns None when nothing was requested. A flag-to-handler table
+    rather than argparse subcommands keeps the established CLI
+    ('cheat tar', 'cheat -l') unchanged.
+    """
+    if args.directories:
+        return _cmd_directories
+    if args.list:
+        return _cmd_list
+    if args.search:
+        return _cmd_search
+    if args.edit:
+        return _cmd_edit
+    if args.open:
+        return _cmd_open
+    if args.cheatname:
+        return _cmd_view
+    return None
 
 def main():
     parser = argparse.ArgumentParser(description="Create and view interactive cheatsheets.")
@@ -282,58 +677,33 @@ def main():
     parser.add_argument("-o", "--open", action="store_true", help="Open cheatsheet in default app.")
     parser.add_argument("-d", "--directories", action="store_true", help="List configured cheatpaths.")
     parser.add_argument("--conf", default=os.path.expanduser("~/.config/cheat/conf.yml"), help="Path to config file.")
-    
-    # We might need to handle the case where conf.yml is in current dir or specific location?
-    # User env: /Users/cche/git/ch/conf.yml. I will default to look there for this task if not specified? 
-    # Or just rely on the argument. 
-    # For this specific task, the User provided @[conf.yml], so it's likely expected to work with that or default user config.
-    # I'll default to looking in local dir first for dev purposes if not found in standard locations.
-    
+
     args = parser.parse_args()
-    
+
+    # Validate the name once up front instead of abspath-checking every
+    # probe in find_cheatsheet: no absolute paths, no '..' components.
+    name = args.cheatname
+    if name and (os.path.isabs(name) or '..' in name.replace(os.sep, '/').split('/')):
+        sys.exit(f"Error: invalid cheatsheet name: {name}")
+
+    # Nothing asked for? Print help before touching the config or the
+    # filesystem at all (--help itself already exits inside parse_args).
+    command = _resolve_command(args)
+    if command is None:
+        parser.print_help()
+        return
+
     # Config resolution
     config_path = args.conf
     # Fallback to local 'conf.yml' if default doesn't exist but local does (for dev context)
     if config_path == os.path.expanduser("~/.config/cheat/conf.yml") and not os.path.exists(config_path):
         if os.path.exists("conf.yml"):
             config_path = "conf.yml"
-            
+
     config = load_config(config_path)
     paths = get_cheatpaths(config)
-    
-    if args.directories:
-        for p in paths:
-            print(f"{p['name']}: {p['path']} (readonly: {p.get('readonly', False)})")
-        return
-
-    if args.list:
-        list_cheatsheets(paths, args.path)
-        return
-
-    if args.search:
-        search_cheatsheets(args.search, paths)
-        return
-
-    if args.edit:
-        if not args.cheatname:
-            print("Error: Please specify a cheatsheet to edit.")
-            sys.exit(1)
-        edit_cheatsheet(args.cheatname, paths, config)
-        return
 
-    if args.open:
-        if not args.cheatname:
-            print("Error: Please specify a cheatsheet to open.")
-            sys.exit(1)
-        open_cheatsheet(args.cheatname, paths, config)
-        return
-
-    if args.cheatname:
-        view_cheatsheet(args.cheatname, paths, config)
-        return
-        
-    # If no args, print help
-    parser.print_help()
+    command(args, paths, config)
 
 if __name__ == "__main__":
     main()